@@ -4,6 +4,7 @@ from uuid import UUID
 from typing import List
 from fastapi import Body, FastAPI, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
@@ -133,18 +134,15 @@ def create_calculation(
     computes the result using the appropriate operation, and assigns the authenticated user's ID.
     """
     try:
-        # Create the calculation using the factory method.
-        new_calculation = Calculation.create(
-            calculation_type=calculation_data.type,
+        # Compute and insert the calculation in one INSERT ... RETURNING,
+        # without going through the ORM unit of work.
+        new_calculation = Calculation.insert_row(
+            db,
+            calculation_type=calculation_data.type.value,
             user_id=current_user.id,
             inputs=calculation_data.inputs,
         )
-        new_calculation.result = new_calculation.get_result()
-
-        # Persist the calculation to the database.
-        db.add(new_calculation)
         db.commit()
-        db.refresh(new_calculation)
         return new_calculation
 
     except ValueError as e: # pragma: no cover
@@ -204,7 +202,7 @@ def update_calculation(
     if calculation_update.inputs is not None:
         calculation.inputs = calculation_update.inputs
         calculation.result = calculation.get_result()
-    calculation.updated_at = datetime.utcnow()
+    calculation.updated_at = func.now()
     db.commit()
     db.refresh(calculation)
     return calculation
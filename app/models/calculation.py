@@ -1,18 +1,63 @@
 # app/models/calculation.py
-from datetime import datetime
 import uuid
+from enum import IntEnum
 from typing import List
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship, declared_attr
-from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy import (
+    CheckConstraint, Column, DateTime, ForeignKey, Index, JSON, SmallInteger,
+    TypeDecorator, func, insert, select,
+)
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, UUID
+from sqlalchemy.orm import has_inherited_table, relationship, declared_attr, selectinload
 from app.database import Base
+from app.schemas.calculation import CALC_CREATE_ADAPTER
+
+# Rows per multi-row INSERT in bulk_create; keeps each statement well under
+# the server's bind-parameter limit.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+class CalcKind(IntEnum):
+    """Stored values of the calculation type discriminator"""
+    CALCULATION = 0
+    ADDITION = 1
+    SUBTRACTION = 2
+    MULTIPLICATION = 3
+    DIVISION = 4
+
+_KIND_BY_NAME = {kind.name.lower(): kind for kind in CalcKind}
+
+class CalcKindType(TypeDecorator):
+    """
+    Store the calculation type name as a SMALLINT.
+
+    Python code keeps working with the lowercase type names ('addition', ...)
+    while the database column and its indexes hold 2-byte integers.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return _KIND_BY_NAME[value]
+        except KeyError:
+            raise ValueError(f"Unsupported calculation type: {value}")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return CalcKind(value).name.lower()
 
 class AbstractCalculation:
     """Abstract base class for calculations"""
     
     @declared_attr
     def __tablename__(cls):
+        # Subclasses share the parent's table (single-table inheritance), so
+        # only the root class names it; this lets the ORM add the type
+        # criterion when querying a subclass.
+        if has_inherited_table(cls):
+            return None
         return 'calculations'
 
     @declared_attr
@@ -29,16 +74,15 @@ class AbstractCalculation:
         return Column(
             UUID(as_uuid=True), 
             ForeignKey('users.id', ondelete='CASCADE'),
-            nullable=False,
-            index=True
+            nullable=False
         )
 
     @declared_attr
     def type(cls):
         return Column(
-            String(50), 
-            nullable=False,
-            index=True
+            CalcKindType,
+            CheckConstraint(f"type BETWEEN {int(min(CalcKind))} AND {int(max(CalcKind))}"),
+            nullable=False
         )
 
     @declared_attr
@@ -51,82 +95,186 @@ class AbstractCalculation:
     @declared_attr
     def result(cls):
         return Column(
-            Float,
+            DOUBLE_PRECISION,
             nullable=True
         )
 
     @declared_attr
     def created_at(cls):
         return Column(
-            DateTime, 
-            default=datetime.utcnow,
+            DateTime(timezone=True),
+            server_default=func.now(),
             nullable=False
         )
 
     @declared_attr
     def updated_at(cls):
         return Column(
-            DateTime, 
-            default=datetime.utcnow,
-            onupdate=datetime.utcnow,
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
             nullable=False
         )
 
     @declared_attr
     def user(cls):
-        return relationship("User", back_populates="calculations")
+        # Lazy loads raise so that N+1 access patterns fail loudly; load the
+        # owner explicitly, e.g. via query_with_user().
+        return relationship("User", back_populates="calculations", lazy="raise")
 
     @classmethod
     def create(cls, calculation_type: str, user_id: uuid.UUID, inputs: List[float]) -> "Calculation":
-        """Factory method to create calculations"""
-        calculation_classes = {
-            'addition': Addition,
-            'subtraction': Subtraction,
-            'multiplication': Multiplication,
-            'division': Division,
-        }
-        calculation_class = calculation_classes.get(calculation_type.lower())
+        """Factory method to create calculations from a lowercase type name"""
+        # Callers pass the type already normalized by the calculation schemas;
+        # anything else misses the lookup and is rejected below.
+        calculation_class = _CALC_CLASSES.get(calculation_type)
         if not calculation_class:
             raise ValueError(f"Unsupported calculation type: {calculation_type}")
         return calculation_class(user_id=user_id, inputs=inputs)
 
+    @classmethod
+    def query_with_user(cls, session, user_id: uuid.UUID):
+        """
+        Select a user's calculations with the owning User eagerly loaded.
+
+        The owner is fetched with one additional SELECT ... IN query rather
+        than one query per calculation.
+
+        Args:
+            session: SQLAlchemy database session
+            user_id: ID of the user whose calculations to load
+
+        Returns:
+            ScalarResult: The user's calculations
+        """
+        return session.scalars(
+            select(cls)
+            .where(cls.user_id == user_id)
+            .options(selectinload(cls.user))
+        )
+
+    @classmethod
+    def insert_row(cls, session, calculation_type: str, user_id: uuid.UUID, inputs: List[float]) -> dict:
+        """
+        Compute and insert a single calculation through a prebuilt Core INSERT.
+
+        This bypasses the ORM entirely: no mapped instance is built or added
+        to the session, and the stored row is returned by INSERT ... RETURNING.
+
+        Args:
+            session: SQLAlchemy database session
+            calculation_type: Lowercase calculation type name, e.g. 'addition'
+            user_id: ID of the owning user
+            inputs: Numeric inputs for the calculation
+
+        Returns:
+            dict: The inserted row, including its generated id and timestamps
+
+        Raises:
+            ValueError: If the type is unsupported or the result cannot be computed
+        """
+        row = session.execute(_CALC_INSERT, {
+            "user_id": user_id,
+            "type": calculation_type,
+            "inputs": inputs,
+            "result": cls.compute_result(calculation_type, inputs),
+        }).mappings().one()
+        return dict(row)
+
+    @classmethod
+    def bulk_create(cls, session, items: List[dict]) -> List["Calculation"]:
+        """
+        Insert many calculations using multi-row INSERT ... RETURNING statements.
+
+        Every item is validated against CalculationCreate and its result is
+        computed before anything is sent to the database. The inserted rows,
+        including their server-generated ids and timestamps, come back from
+        the same statements, so no follow-up SELECT is needed. The session is
+        not committed; that is left to the caller.
+
+        Args:
+            session: SQLAlchemy database session
+            items: Dictionaries with 'type', 'inputs' and 'user_id' keys
+
+        Returns:
+            List[Calculation]: The inserted calculations, in input order
+
+        Raises:
+            ValueError: If any item fails validation or its result cannot be computed
+        """
+        rows = []
+        for item in items:
+            data = CALC_CREATE_ADAPTER.validate_python(item)
+            calculation_type = data.type.value
+            rows.append({
+                "user_id": data.user_id,
+                "type": calculation_type,
+                "inputs": data.inputs,
+                "result": cls.compute_result(calculation_type, data.inputs),
+            })
+
+        statement = insert(Calculation).returning(Calculation, sort_by_parameter_order=True)
+        calculations = []
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            calculations.extend(session.scalars(statement, chunk))
+        return calculations
+
+    @classmethod
+    def compute(cls, inputs: List[float]) -> float:
+        """Compute the result for the given inputs without a mapped instance"""
+        raise NotImplementedError
+
+    @classmethod
+    def compute_result(cls, calculation_type: str, inputs: List[float]) -> float:
+        """Compute the result of a calculation type directly from its inputs"""
+        calculation_class = _CALC_CLASSES.get(calculation_type)
+        if not calculation_class:
+            raise ValueError(f"Unsupported calculation type: {calculation_type}")
+        return calculation_class.compute(inputs)
+
     def get_result(self) -> float:
         """Method to compute calculation result"""
-        raise NotImplementedError
+        return self.compute(self.inputs)
 
     def __repr__(self):
         return f"<Calculation(type={self.type}, inputs={self.inputs})>"
 
 class Calculation(Base, AbstractCalculation):
     """Base calculation model"""
+    # Serves lookups by user_id alone as well as by (user_id, type).
+    __table_args__ = (
+        Index('ix_calc_user_type', 'user_id', 'type'),
+    )
     __mapper_args__ = {
         "polymorphic_on": "type",
         "polymorphic_identity": "calculation",
-        #"with_polymorphic": "*"
     }
 
 class Addition(Calculation):
     """Addition calculation"""
     __mapper_args__ = {"polymorphic_identity": "addition"}
 
-    def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
+    @classmethod
+    def compute(cls, inputs: List[float]) -> float:
+        if not isinstance(inputs, list):
             raise ValueError("Inputs must be a list of numbers.")
-        if len(self.inputs) < 2:
+        if len(inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        return sum(self.inputs)
+        return sum(inputs)
 
 class Subtraction(Calculation):
     """Subtraction calculation"""
     __mapper_args__ = {"polymorphic_identity": "subtraction"}
 
-    def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
+    @classmethod
+    def compute(cls, inputs: List[float]) -> float:
+        if not isinstance(inputs, list):
             raise ValueError("Inputs must be a list of numbers.")
-        if len(self.inputs) < 2:
+        if len(inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
+        result = inputs[0]
+        for value in inputs[1:]:
             result -= value
         return result
 
@@ -134,13 +282,14 @@ class Multiplication(Calculation):
     """Multiplication calculation"""
     __mapper_args__ = {"polymorphic_identity": "multiplication"}
 
-    def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
+    @classmethod
+    def compute(cls, inputs: List[float]) -> float:
+        if not isinstance(inputs, list):
             raise ValueError("Inputs must be a list of numbers.")
-        if len(self.inputs) < 2:
+        if len(inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
         result = 1
-        for value in self.inputs:
+        for value in inputs:
             result *= value
         return result
 
@@ -148,14 +297,28 @@ class Division(Calculation):
     """Division calculation"""
     __mapper_args__ = {"polymorphic_identity": "division"}
 
-    def get_result(self) -> float:
-        if not isinstance(self.inputs, list):
+    @classmethod
+    def compute(cls, inputs: List[float]) -> float:
+        if not isinstance(inputs, list):
             raise ValueError("Inputs must be a list of numbers.")
-        if len(self.inputs) < 2:
+        if len(inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            if value == 0:
-                raise ValueError("Cannot divide by zero.")
-            result /= value
+        result = inputs[0]
+        try:
+            for value in inputs[1:]:
+                result /= value
+        except ZeroDivisionError:
+            raise ValueError("Cannot divide by zero.")
         return result
+
+# Factory dispatch table for Calculation.create, built once at import time.
+_CALC_CLASSES = {
+    'addition': Addition,
+    'subtraction': Subtraction,
+    'multiplication': Multiplication,
+    'division': Division,
+}
+
+# Core INSERT for Calculation.insert_row, compiled once and reused from the
+# statement cache on every call.
+_CALC_INSERT = insert(Calculation.__table__).returning(*Calculation.__table__.c)
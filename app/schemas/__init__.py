@@ -14,7 +14,8 @@ from .calculation import (
     CalculationBase,
     CalculationCreate,
     CalculationUpdate,
-    CalculationResponse
+    CalculationResponse,
+    CALC_CREATE_ADAPTER
 )
 
 __all__ = [
@@ -32,4 +33,5 @@ __all__ = [
     'CalculationCreate',
     'CalculationUpdate',
     'CalculationResponse',
+    'CALC_CREATE_ADAPTER',
 ]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, model_validator, field_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, model_validator
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
@@ -11,45 +11,53 @@ class CalculationType(str, Enum):
     MULTIPLICATION = "multiplication"
     DIVISION = "division"
 
+_ALLOWED_TYPES: frozenset[str] = frozenset(e.value for e in CalculationType)
+_INVALID_TYPE_MESSAGE = f"Type must be one of: {', '.join(sorted(_ALLOWED_TYPES))}"
+
 class CalculationBase(BaseModel):
     type: CalculationType = Field(
         ...,
-        description="Type of calculation (addition, subtraction, multiplication, division)",
-        example="addition"
+        description="Type of calculation (addition, subtraction, multiplication, division)"
     )
     inputs: List[float] = Field(
         ...,
         description="List of numeric inputs for the calculation",
-        example=[10.5, 3, 2],
-        min_items=2
+        min_length=2
     )
 
-    @field_validator("type", mode="before")
-    @classmethod
-    def validate_type(cls, v):
-        allowed = {e.value for e in CalculationType}
-        # Ensure v is a string and check (in lowercase) if it's allowed.
-        if not isinstance(v, str) or v.lower() not in allowed:
-            raise ValueError(f"Type must be one of: {', '.join(sorted(allowed))}")
-        return v.lower()
-
-    @field_validator("inputs", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def check_inputs_is_list(cls, v):
-        if not isinstance(v, list):
-            raise ValueError("Input should be a valid list")
-        return v
-
-    @model_validator(mode='after')
-    def validate_inputs(self) -> "CalculationBase":
-        """Validate inputs based on calculation type"""
-        if len(self.inputs) < 2:
-            raise ValueError("At least two numbers are required for calculation")
-        if self.type == CalculationType.DIVISION:
-            # Prevent division by zero (skip the first value as numerator)
-            if any(x == 0 for x in self.inputs[1:]):
-                raise ValueError("Cannot divide by zero")
-        return self
+    def validate_raw_fields(cls, data):
+        """Normalize 'type' and validate 'inputs' against it in a single pass"""
+        # Attribute sources (from_attributes) and missing fields are left to
+        # the regular field validation.
+        if not isinstance(data, dict):
+            return data
+        if "type" in data:
+            v = data["type"]
+            # Ensure v is a string and check (in lowercase) if it's allowed.
+            if not isinstance(v, str):
+                raise ValueError(_INVALID_TYPE_MESSAGE)
+            v = v.lower()
+            if v not in _ALLOWED_TYPES:
+                raise ValueError(_INVALID_TYPE_MESSAGE)
+            data = {**data, "type": v}
+        if "inputs" in data:
+            inputs = data["inputs"]
+            if not isinstance(inputs, list):
+                raise ValueError("Input should be a valid list")
+            # bool is a subclass of int, so reject it explicitly.
+            for x in inputs:
+                if not isinstance(x, (int, float)) or isinstance(x, bool):
+                    raise ValueError("Inputs must be numbers")
+            if len(inputs) < 2:
+                raise ValueError("At least two numbers are required for calculation")
+            # 'type' is already lowercased above, so a plain string compare suffices.
+            if data.get("type") == CalculationType.DIVISION.value:
+                # Prevent division by zero (skip the first value as numerator)
+                if any(x == 0 for x in inputs[1:]):
+                    raise ValueError("Cannot divide by zero")
+        return data
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -65,8 +73,7 @@ class CalculationCreate(CalculationBase):
     """Schema for creating a new Calculation"""
     user_id: UUID = Field(
         ...,
-        description="UUID of the user who owns this calculation",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        description="UUID of the user who owns this calculation"
     )
 
     model_config = ConfigDict(
@@ -79,13 +86,16 @@ class CalculationCreate(CalculationBase):
         }
     )
 
+# Prebuilt validator for CalculationCreate; reuse it on hot paths instead of
+# calling CalculationCreate(**data).
+CALC_CREATE_ADAPTER = TypeAdapter(CalculationCreate)
+
 class CalculationUpdate(BaseModel):
     """Schema for updating an existing Calculation"""
     inputs: Optional[List[float]] = Field(
         None,
         description="Updated list of numeric inputs for the calculation",
-        example=[42, 7],
-        min_items=2
+        min_length=2
     )
 
     @model_validator(mode='after')
@@ -104,20 +114,17 @@ class CalculationResponse(CalculationBase):
     """Schema for reading a Calculation from the database"""
     id: UUID = Field(
         ...,
-        description="Unique UUID of the calculation",
-        example="123e4567-e89b-12d3-a456-426614174999"
+        description="Unique UUID of the calculation"
     )
     user_id: UUID = Field(
         ...,
-        description="UUID of the user who owns this calculation",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        description="UUID of the user who owns this calculation"
     )
     created_at: datetime = Field(..., description="Time when the calculation was created")
     updated_at: datetime = Field(..., description="Time when the calculation was last updated")
     result: float = Field(
         ...,
-        description="Result of the calculation",
-        example=15.5
+        description="Result of the calculation"
     )
 
     model_config = ConfigDict(
@@ -1,5 +1,7 @@
 import pytest
 import uuid
+from sqlalchemy import Integer, cast, event, select
+from sqlalchemy.exc import InvalidRequestError
 
 from app.models.calculation import (
     Calculation,
@@ -7,6 +9,7 @@ from app.models.calculation import (
     Subtraction,
     Multiplication,
     Division,
+    CalcKind,
 )
 
 # Helper function to create a dummy user_id for testing.
@@ -127,6 +130,40 @@ def test_calculation_factory_invalid_type():
             inputs=[10, 3],
         )
 
+def test_compute_result_without_instance():
+    """
+    Test that Calculation.compute_result matches get_result for every calculation type.
+    """
+    inputs = [100, 2, 5]
+    for calc_type in ("addition", "subtraction", "multiplication", "division"):
+        calc = Calculation.create(calc_type, dummy_user_id(), inputs)
+        assert Calculation.compute_result(calc_type, inputs) == calc.get_result()
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        Calculation.compute_result("modulus", inputs)
+    with pytest.raises(ValueError, match="Cannot divide by zero."):
+        Calculation.compute_result("division", [1, 0])
+
+def test_calculation_factory_requires_lowercase_type():
+    """
+    Test that Calculation.create rejects a type that was not normalized to lowercase.
+    """
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        Calculation.create(
+            calculation_type='Addition',
+            user_id=dummy_user_id(),
+            inputs=[1, 2],
+        )
+
+def test_polymorphic_identities_are_distinct():
+    """
+    Test that every calculation subclass maps to its own polymorphic identity.
+    """
+    polymorphic_map = Calculation.__mapper__.polymorphic_map
+    assert polymorphic_map["addition"].class_ is Addition
+    assert polymorphic_map["subtraction"].class_ is Subtraction
+    assert polymorphic_map["multiplication"].class_ is Multiplication
+    assert polymorphic_map["division"].class_ is Division
+
 def test_invalid_inputs_for_addition():
     """
     Test that providing non-list inputs to Addition.get_result raises a ValueError.
@@ -150,3 +187,135 @@ def test_invalid_inputs_for_division():
     division = Division(user_id=dummy_user_id(), inputs=[10])
     with pytest.raises(ValueError, match="Inputs must be a list with at least two numbers."):
         division.get_result()
+
+def test_bulk_create_inserts_all_rows(db_session, test_user):
+    """
+    Test that Calculation.bulk_create persists every row with its computed result.
+    """
+    items = [
+        {"type": "addition", "inputs": [1, 2, 3], "user_id": test_user.id},
+        {"type": "division", "inputs": [100, 4], "user_id": test_user.id},
+    ]
+    inserted = Calculation.bulk_create(db_session, items)
+
+    assert [type(calc) for calc in inserted] == [Addition, Division]
+    assert all(calc.id is not None and calc.created_at is not None for calc in inserted)
+    db_session.commit()
+
+    calcs = db_session.query(Calculation).filter(Calculation.user_id == test_user.id).all()
+    results = sorted((type(calc).__name__, calc.result) for calc in calcs)
+    assert results == [("Addition", 6), ("Division", 25)]
+
+def test_bulk_create_batches_ordered_returning(db_session, test_user):
+    """
+    Test that Calculation.bulk_create returns rows in input order from a single INSERT.
+    """
+    items = [
+        {"type": calc_type, "inputs": [8, 2], "user_id": test_user.id}
+        for calc_type in ("division", "addition", "subtraction", "multiplication")
+    ]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        inserted = Calculation.bulk_create(db_session, items)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [calc.result for calc in inserted] == [4, 10, 6, 16]
+    assert len([s for s in statements if s.lstrip().upper().startswith("INSERT")]) == 1
+
+def test_bulk_create_rejects_invalid_row(db_session, test_user):
+    """
+    Test that Calculation.bulk_create inserts nothing if any row is invalid.
+    """
+    items = [
+        {"type": "addition", "inputs": [1, 2], "user_id": test_user.id},
+        {"type": "division", "inputs": [1, 0], "user_id": test_user.id},
+    ]
+    with pytest.raises(ValueError):
+        Calculation.bulk_create(db_session, items)
+    count = db_session.query(Calculation).filter(Calculation.user_id == test_user.id).count()
+    assert count == 0
+
+def test_query_with_user_loads_owner(db_session, test_user):
+    """
+    Test that Calculation.query_with_user returns calculations with the user loaded.
+    """
+    user_id = test_user.id
+    Calculation.bulk_create(db_session, [
+        {"type": "addition", "inputs": [1, 2], "user_id": user_id},
+        {"type": "subtraction", "inputs": [5, 3], "user_id": user_id},
+    ])
+    db_session.commit()
+    db_session.expunge_all()
+
+    calcs = Calculation.query_with_user(db_session, user_id).all()
+    assert len(calcs) == 2
+    assert all(calc.user.id == user_id for calc in calcs)
+
+def test_query_with_user_on_subclass_filters_type(db_session, test_user):
+    """
+    Test that query_with_user on a subclass returns only that calculation type.
+    """
+    user_id = test_user.id
+    Calculation.bulk_create(db_session, [
+        {"type": "addition", "inputs": [1, 2], "user_id": user_id},
+        {"type": "subtraction", "inputs": [5, 3], "user_id": user_id},
+    ])
+    db_session.commit()
+
+    calcs = Addition.query_with_user(db_session, user_id).all()
+    assert [type(calc) for calc in calcs] == [Addition]
+    assert calcs[0].user.id == user_id
+
+def test_lazy_user_access_raises(db_session, test_user):
+    """
+    Test that accessing Calculation.user without eager loading raises.
+    """
+    user_id = test_user.id
+    Calculation.bulk_create(db_session, [
+        {"type": "addition", "inputs": [1, 2], "user_id": user_id},
+    ])
+    db_session.commit()
+    db_session.expunge_all()
+
+    calc = db_session.query(Calculation).filter(Calculation.user_id == user_id).first()
+    with pytest.raises(InvalidRequestError):
+        calc.user
+
+def test_type_stored_as_small_integer(db_session, test_user):
+    """
+    Test that the type discriminator is stored as a CalcKind integer but read back as a name.
+    """
+    user_id = test_user.id
+    Calculation.bulk_create(db_session, [
+        {"type": "multiplication", "inputs": [2, 3], "user_id": user_id},
+    ])
+    db_session.commit()
+
+    raw = db_session.execute(
+        select(cast(Calculation.type, Integer)).where(Calculation.user_id == user_id)
+    ).scalar_one()
+    assert raw == CalcKind.MULTIPLICATION
+    calc = db_session.query(Calculation).filter(Calculation.type == "multiplication").first()
+    assert isinstance(calc, Multiplication)
+    assert calc.type == "multiplication"
+
+def test_insert_row_returns_stored_row(db_session, test_user):
+    """
+    Test that Calculation.insert_row persists the calculation and returns the stored row.
+    """
+    user_id = test_user.id
+    row = Calculation.insert_row(db_session, "subtraction", user_id, [10, 4])
+    db_session.commit()
+
+    assert row["type"] == "subtraction"
+    assert row["result"] == 6
+    assert row["id"] is not None and row["created_at"] is not None
+    calc = db_session.query(Calculation).filter(Calculation.id == row["id"]).one()
+    assert isinstance(calc, Subtraction)
@@ -5,7 +5,8 @@ from datetime import datetime
 from app.schemas.calculation import (
     CalculationCreate,
     CalculationUpdate,
-    CalculationResponse
+    CalculationResponse,
+    CALC_CREATE_ADAPTER
 )
 
 def test_calculation_create_valid():
@@ -55,6 +56,40 @@ def test_calculation_create_invalid_inputs():
     # Ensure that our custom error message is present (case-insensitive)
     assert "input should be a valid list" in error_message.lower(), error_message
 
+@pytest.mark.parametrize("bad_value", [True, "3", None])
+def test_calculation_create_non_numeric_inputs(bad_value):
+    """Test CalculationCreate rejects inputs that are not int or float."""
+    data = {
+        "type": "addition",
+        "inputs": [1, bad_value],
+        "user_id": uuid4()
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationCreate(**data)
+    assert "inputs must be numbers" in str(exc_info.value).lower()
+
+def test_calculation_create_division_by_zero():
+    """Test CalculationCreate rejects a zero divisor for division."""
+    data = {
+        "type": "DIVISION",
+        "inputs": [10, 0],
+        "user_id": uuid4()
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationCreate(**data)
+    assert "cannot divide by zero" in str(exc_info.value).lower()
+
+def test_calculation_create_too_few_inputs():
+    """Test CalculationCreate requires at least two inputs."""
+    data = {
+        "type": "addition",
+        "inputs": [10],
+        "user_id": uuid4()
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationCreate(**data)
+    assert "at least two numbers" in str(exc_info.value).lower()
+
 def test_calculation_create_unsupported_type():
     """Test CalculationCreate fails if an unsupported calculation type is provided."""
     data = {
@@ -68,6 +103,18 @@ def test_calculation_create_unsupported_type():
     # Check that the error message indicates the value is not permitted.
     assert "one of" in error_message or "not a valid" in error_message
 
+def test_calc_create_adapter_matches_model():
+    """Test CALC_CREATE_ADAPTER validates the same way as CalculationCreate."""
+    data = {
+        "type": "Division",
+        "inputs": [100, 4],
+        "user_id": uuid4()
+    }
+    calc = CALC_CREATE_ADAPTER.validate_python(data)
+    assert calc == CalculationCreate(**data)
+    with pytest.raises(ValidationError):
+        CALC_CREATE_ADAPTER.validate_python({**data, "inputs": [100, 0]})
+
 def test_calculation_update_valid():
     """Test a valid partial update with CalculationUpdate."""
     data = {
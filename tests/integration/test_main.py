@@ -208,6 +208,13 @@ def test_create_calculation_success(client_fixture):
     assert response.json()["inputs"] == [1, 2, 3]
     assert response.json()["result"] == 6
     assert response.json()["user_id"] == str(UUID("a2b1c0d3-e4f5-6789-abcd-ef0123456789"))
+    # The row returned by INSERT ... RETURNING carries the generated fields.
+    assert UUID(response.json()["id"])
+    assert response.json()["created_at"] is not None
+    assert response.json()["updated_at"] is not None
+    get_response = client_fixture.get(f"/calculations/{response.json()['id']}")
+    assert get_response.status_code == 200
+    assert get_response.json()["result"] == 6
 
 def test_login_json_success(client_fixture):
     # First, register a user